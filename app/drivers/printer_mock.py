@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Iterable
 
 from app.config import DEFAULT_CUTTER_FEED_LINES
 
@@ -10,6 +11,17 @@ class PrinterDriver:
     SPACING_MEDIUM = 8
     SPACING_LARGE = 16
 
+    # Console markers standing in for each text style
+    STYLE_MARKERS = {
+        "regular": "",
+        "bold": "**",
+        "bold_lg": "▓▓",
+        "medium": "░░",
+        "semibold": "▒▒",
+        "light": "··",
+        "regular_sm": "  ",
+    }
+
     def __init__(
         self,
         width: int = 42,  # Characters per line
@@ -38,22 +50,23 @@ class PrinterDriver:
         """
         if not text:
             return
-            
-        style_markers = {
-            "regular": "",
-            "bold": "**",
-            "bold_lg": "▓▓",
-            "medium": "░░",
-            "semibold": "▒▒",
-            "light": "··",
-            "regular_sm": "  ",
-        }
-        marker = style_markers.get(style, "")
+        self.print_lines([text], style)
+
+    def print_lines(self, lines: Iterable[str], style: str = "regular"):
+        """Simulates printing several lines of text in one style.
+
+        Same as calling print_text for each line; empty strings are kept as
+        blank lines.
+        """
+        lines = list(lines)
+        if not lines:
+            return
+
+        marker = self.STYLE_MARKERS.get(style, "")
         prefix = f"{marker} " if marker else ""
-        
+
         # Split by newlines to handle multi-line text properly
-        lines = text.split('\n')
-        for line in lines:
+        for line in "\n".join(lines).split('\n'):
             # Print all lines (including blank lines for spacing)
             print(f"[PRINT] {prefix}{line}")
             self.lines_printed += 1
@@ -1,3 +1,5 @@
+import functools
+import glob
 import math
 import os
 import platform
@@ -7,7 +9,7 @@ import time
 import unicodedata
 import logging
 from datetime import datetime, date
-from typing import List, Optional, Any
+from typing import Any, Callable, Iterable, List, Optional
 
 import serial
 from PIL import Image, ImageDraw, ImageFont
@@ -22,6 +24,297 @@ except Exception:  # pragma: no cover - non-Pi environments
 
 logger = logging.getLogger(__name__)
 
+# Host OS, fixed for the life of the process; picks the port candidates.
+_SYSTEM = platform.system()
+
+# Serial port found by the Linux auto-detect scan, reused by later instances
+# (reconnects, re-inits) so they skip re-scanning while it is still present.
+_discovered_port: Optional[str] = None
+
+# USB serial device prefixes in the order auto-detect prefers them.
+_USB_PORT_PREFIXES = ("/dev/ttyUSB", "/dev/ttyACM")
+
+
+def _port_sort_key(port: str) -> tuple:
+    """Order extra adapters like the fixed list: ttyUSB before ttyACM, by number."""
+    for rank, prefix in enumerate(_USB_PORT_PREFIXES):
+        if port.startswith(prefix):
+            suffix = port[len(prefix):]
+            if suffix.isdigit():
+                return (rank, int(suffix), "")
+            return (rank, float("inf"), suffix)
+    return (len(_USB_PORT_PREFIXES), float("inf"), port)
+
+
+def _autodetect_port() -> str:
+    """Pick the printer's serial port for this host.
+
+    A port found by the Linux scan is remembered for the rest of the process
+    while the device still exists; if it disappears (unplugged, or the adapter
+    re-enumerated under another name) the scan runs again. The /dev/serial0
+    fallback is not remembered, so an adapter plugged in later is still found
+    on the next init.
+    """
+    global _discovered_port
+    if _discovered_port:
+        if os.path.exists(_discovered_port):
+            return _discovered_port
+        _discovered_port = None
+
+    if _SYSTEM == "Linux":
+        # Try GPIO serial first (primary interface)
+        possible_ports = [
+            "/dev/serial0",  # GPIO serial - needs console disabled
+            "/dev/ttyUSB0",
+            "/dev/ttyUSB1",
+            "/dev/ttyACM0",
+            "/dev/ttyACM1",
+        ]
+        # List the USB adapters actually present in one scan each
+        # instead of stat'ing every candidate; this also picks up
+        # adapters enumerated past the fixed list (e.g. ttyUSB2).
+        present = set()
+        for prefix in _USB_PORT_PREFIXES:
+            present.update(glob.glob(prefix + "*"))
+        if os.path.exists("/dev/serial0"):
+            present.add("/dev/serial0")
+        possible_ports += sorted(present.difference(possible_ports), key=_port_sort_key)
+        # Use the first one that exists
+        for p in possible_ports:
+            if p in present:
+                _discovered_port = p
+                return p
+        return "/dev/serial0"  # Default for GPIO serial
+    elif _SYSTEM == "Windows":
+        # Windows COM ports
+        return "COM1"
+    return "/dev/tty.usbserial"
+
+
+# ESC J n (feed n dots) and ESC d n (print and feed n lines) for every n,
+# so feed commands are looked up instead of built per chunk.
+_ESC_J_CMD = tuple(b"\x1b\x4a" + bytes([n]) for n in range(256))
+_ESC_D_CMD = tuple(b"\x1b\x64" + bytes([n]) for n in range(256))
+
+
+def _esc_j_feed(dots: int) -> bytes:
+    """ESC J commands that feed `dots` dots, split into <=255-dot steps."""
+    full, rest = divmod(dots, 255)
+    return _ESC_J_CMD[255] * full + (_ESC_J_CMD[rest] if rest else b"")
+
+
+# Byte table that flips every bit, for turning PIL's packed 1-bit raster
+# (1 = white) into printer raster bytes (1 = black dot) in one translate().
+_INVERT_BITS = bytes(b ^ 0xFF for b in range(256))
+
+
+# ASCII control bytes dropped by _sanitize_text (everything below 0x20 except
+# tab/newline/CR, plus DEL).
+_CONTROL_BYTES = bytes(c for c in range(0x20) if c not in (0x09, 0x0A, 0x0D)) + b"\x7f"
+
+# Character translation table: maps problematic Unicode chars to ASCII equivalents
+# Using Unicode escapes to prevent formatter corruption
+_CHAR_REPLACEMENTS = str.maketrans(
+    {
+        "\u201c": '"',  # Left double quote "
+        "\u201d": '"',  # Right double quote "
+        "\u2018": "'",  # Left single quote '
+        "\u2019": "'",  # Right single quote '
+        "\u2013": "-",  # En dash –
+        "\u2014": "-",  # Em dash —
+        "\u2026": "...",  # Ellipsis …
+        "\u2022": "*",  # Bullet •
+        "\u00b0": "o",  # Degree °
+        "\u00a9": "(c)",  # Copyright ©
+        "\u00ae": "(R)",  # Registered ®
+        "\u2122": "(TM)",  # Trademark ™
+        "\u00d7": "x",  # Multiplication ×
+        "\u00f7": "/",  # Division ÷
+        "\u20ac": "EUR",  # Euro €
+        "\u00a3": "GBP",  # Pound £
+        "\u00a5": "JPY",  # Yen ¥
+        "\u00a0": " ",  # Non-breaking space
+        "\u200b": "",  # Zero-width space
+        "\u200c": "",  # Zero-width non-joiner
+        "\u200d": "",  # Zero-width joiner
+        "\ufeff": "",  # BOM
+    }
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _sanitize_ascii(text: str) -> str:
+    """Pipeline behind PrinterDriver._sanitize_text.
+
+    Cached because labels, headings and list items repeat across receipts.
+    """
+    # Most receipt text is already ASCII (an O(1) check in CPython): the
+    # replacement table only maps non-ASCII chars and NFKD leaves ASCII
+    # untouched, so only the control-character filter applies.
+    if not text.isascii():
+        # Step 1: Apply known character replacements
+        text = text.translate(_CHAR_REPLACEMENTS)
+
+        # Step 2: Normalize Unicode (decompose accented chars like é -> e + accent).
+        # Skipped when the replacements alone made the text ASCII (smart
+        # quotes, dashes, bullets), since NFKD leaves ASCII unchanged.
+        if not text.isascii():
+            text = unicodedata.normalize("NFKD", text)
+
+    # Step 3: Keep only printable ASCII (0x20-0x7E) plus newline/tab.
+    # Encoding drops non-ASCII and translate drops control bytes, both in C.
+    return (
+        text.encode("ascii", "ignore")
+        .translate(None, _CONTROL_BYTES)
+        .decode("ascii")
+    )
+
+
+# Map icon names to Phosphor icon file names (icons/regular/<name>.png)
+_ICON_ALIASES = {
+    # Common aliases
+    "mail": "envelope",
+    "email": "envelope",
+    "time": "clock",
+    "settings": "gear",
+    "location": "map-pin",
+    "pin": "map-pin",
+    "home": "house",
+    "menu": "list",
+    "search": "magnifying-glass",
+    "magnifying-glass": "magnifying-glass",
+    "magnifying_glass": "magnifying-glass",
+    "save": "floppy-disk",
+    "floppy": "floppy-disk",
+    "checkmark": "check",
+    "check": "check",
+    "close": "x",
+    "delete": "trash",
+    "refresh": "arrows-clockwise",
+    "clear": "sun",
+    "note-pencil": "note-pencil",
+    "note": "note-pencil",
+    "calendar-blank": "calendar-blank",
+    "calendar": "calendar-blank",
+    "envelope-open": "envelope-open",
+    "cloud-sun": "cloud-sun",
+    "moon-stars": "moon-stars",
+    "grid-nine": "grid-nine",
+    "path": "path",
+    "hourglass": "hourglass",
+    "check-square": "check-square",
+    "desktop": "desktop",
+    "quotes": "quotes",
+    "plugs": "plugs",
+    "newspaper": "newspaper",
+    "rss": "rss",
+    "arrow_right": "arrow-right",
+    "wifi": "wifi-high",
+    # Weather icons
+    "rain": "cloud-rain",
+    "snow": "cloud-snow",
+    "snowflake": "snowflake",
+    "storm": "cloud-lightning",
+    "thunder": "cloud-lightning",
+    "lightning": "cloud-lightning",
+    "cloud-fog": "cloud-fog",
+    "fog": "cloud-fog",
+    "mist": "cloud-fog",
+    "cloud-moon": "cloud-moon",
+    "sun-horizon": "sun-horizon",
+    "thermometer": "thermometer",
+    "thermometer-hot": "thermometer-hot",
+    "thermometer-cold": "thermometer-cold",
+    "wind": "wind",
+    "rainbow": "rainbow",
+    "rainbow-cloud": "rainbow-cloud",
+}
+
+
+# Point table for _load_icon: black (0) becomes opaque ink, white clear.
+_INK_IF_ZERO = [255] + [0] * 255
+
+
+@functools.lru_cache(maxsize=64)
+def _load_icon(file_name: str, size: int) -> Optional[Image.Image]:
+    """Load icons/regular/<file_name>.png as a size x size ink mask.
+
+    The mask is an "L" image that is 255 where the icon is black and 0
+    elsewhere, ready to paste black through. Returns None if the PNG is
+    missing or unreadable. Cached because the same few icons are drawn on
+    every receipt (and in both header and icon ops); callers must not modify
+    the returned image.
+    """
+    # Get project root (go up from app/drivers/ to app/, then up to project root)
+    app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # app/
+    project_root = os.path.dirname(app_dir)  # project root
+    icon_path = os.path.join(project_root, "icons", "regular", f"{file_name}.png")
+
+    if not os.path.exists(icon_path):
+        return None
+    try:
+        icon_img = Image.open(icon_path)
+        # Resize if needed
+        if icon_img.size != (size, size):
+            icon_img = icon_img.resize((size, size), Image.NEAREST)
+
+        # Convert to 1-bit if not already
+        if icon_img.mode != "1":
+            icon_img = icon_img.convert("1")
+        # In PIL '1' mode: 0=black, 1=white; only the black pixels get drawn
+        return icon_img.convert("L").point(_INK_IF_ZERO)
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _make_qr_image(
+    data: str, size: int, error_correction: str, fixed_size: bool
+) -> Optional[Image.Image]:
+    """Encoder behind PrinterDriver._generate_qr_image.
+
+    Cached because the same URLs (feeds, settings links) come back on every
+    receipt and Reed-Solomon encoding plus the resize dominate a QR op.
+    """
+    if not data:
+        return None
+
+    try:
+        import qrcode
+
+        # qrcode names its levels ERROR_CORRECT_<L|M|Q|H>; look the one we
+        # need up directly instead of building a map per QR code.
+        ec = error_correction.upper()
+        if ec not in ("L", "M", "Q", "H"):
+            ec = "L"
+        ec_level = getattr(qrcode.constants, "ERROR_CORRECT_" + ec)
+
+        # Use version 1 and let it auto-fit, then resize for consistency
+        # Generate at higher resolution (box_size) for better quality when scaling
+        box_size = max(size, 8) if fixed_size else size
+        qr = qrcode.QRCode(
+            version=1,
+            error_correction=ec_level,
+            box_size=box_size,
+            border=1,
+        )
+        qr.add_data(data)
+        qr.make(fit=True)
+
+        qr_img = qr.make_image(fill_color="black", back_color="white")
+        qr_img = qr_img.convert("1")
+
+        # If fixed_size, resize all QR codes to the same dimensions
+        if fixed_size:
+            # Target size: 80x80 pixels for consistent appearance (for standalone QR codes)
+            target_size = 80
+            # Use LANCZOS for better quality when scaling
+            qr_img = qr_img.resize((target_size, target_size), Image.LANCZOS)
+
+        return qr_img
+    except Exception:
+        return None
+
 
 class PrinterDriver:
     """
@@ -32,34 +325,14 @@ class PrinterDriver:
     # Maximum buffer size to prevent memory issues (roughly 1000 lines)
     MAX_BUFFER_SIZE = 1000
 
-    # Character translation table: maps problematic Unicode chars to ASCII equivalents
-    # Using Unicode escapes to prevent formatter corruption
-    CHAR_REPLACEMENTS = str.maketrans(
-        {
-            "\u201c": '"',  # Left double quote "
-            "\u201d": '"',  # Right double quote "
-            "\u2018": "'",  # Left single quote '
-            "\u2019": "'",  # Right single quote '
-            "\u2013": "-",  # En dash –
-            "\u2014": "-",  # Em dash —
-            "\u2026": "...",  # Ellipsis …
-            "\u2022": "*",  # Bullet •
-            "\u00b0": "o",  # Degree °
-            "\u00a9": "(c)",  # Copyright ©
-            "\u00ae": "(R)",  # Registered ®
-            "\u2122": "(TM)",  # Trademark ™
-            "\u00d7": "x",  # Multiplication ×
-            "\u00f7": "/",  # Division ÷
-            "\u20ac": "EUR",  # Euro €
-            "\u00a3": "GBP",  # Pound £
-            "\u00a5": "JPY",  # Yen ¥
-            "\u00a0": " ",  # Non-breaking space
-            "\u200b": "",  # Zero-width space
-            "\u200c": "",  # Zero-width non-joiner
-            "\u200d": "",  # Zero-width joiner
-            "\ufeff": "",  # BOM
-        }
-    )
+    # Wrapped paragraphs kept per driver (reset when full)
+    WRAP_CACHE_SIZE = 512
+
+    # Loaded font families by font size, shared across instances
+    _font_cache: dict = {}
+
+    # Character translation table (see _CHAR_REPLACEMENTS)
+    CHAR_REPLACEMENTS = _CHAR_REPLACEMENTS
 
     # Printer physical specs
     PRINTER_DPI = 203  # dots per inch
@@ -88,6 +361,9 @@ class PrinterDriver:
         self._io_lock = threading.RLock()
         self._busy_chip = None
         self._busy_handle = None
+        # Set while serial writes keep failing so only the first failure of a
+        # streak is logged at WARNING (a dead link fails every chunk/command).
+        self._write_failing = False
         # Buffer for print operations (prints are always inverted/reversed)
         # Each item is a tuple: ('text', line) or ('feed', count) or ('qr', data).
         self.print_buffer = []
@@ -107,32 +383,20 @@ class PrinterDriver:
 
         # Load font family for styled text
         self._fonts = self._load_font_family()
+        # Style -> line height, filled by _get_line_height_for_style
+        self._line_heights = {}
+        # (text, font, width) -> wrapped lines, filled by _wrap_text_by_width
+        self._wrap_cache = {}
+        # Font -> width measuring function, filled by _get_text_measurer
+        self._text_measurers = {}
+        # (width, dashes) for print_line, computed on first use
+        self._separator = None
+        # Left margin pinned for the duration of a render (see _render_unified_bitmap)
+        self._render_left_margin = None
 
         # Auto-detect serial port if not specified
         if port is None:
-            if platform.system() == "Linux":
-                # Try GPIO serial first (primary interface)
-                possible_ports = [
-                    "/dev/serial0",  # GPIO serial - needs console disabled
-                    "/dev/ttyUSB0",
-                    "/dev/ttyUSB1",
-                    "/dev/ttyACM0",
-                    "/dev/ttyACM1",
-                ]
-                # Use the first one that exists
-                for p in possible_ports:
-                    if os.path.exists(p):
-                        port = p
-                        break
-                if not port:
-                    port = "/dev/serial0"  # Default for GPIO serial
-            elif platform.system() == "Windows":
-                # Windows COM ports
-                possible_ports = [f"COM{i}" for i in range(1, 10)]
-                port = possible_ports[0]
-            else:
-                possible_ports = ["/dev/tty.usbserial", "/dev/ttyUSB0"]
-                port = possible_ports[0]
+            port = _autodetect_port()
 
         self.port = port
 
@@ -150,12 +414,12 @@ class PrinterDriver:
                 timeout=1,
             )
 
-            if self.ser.in_waiting:
-                self.ser.reset_input_buffer()
+            # Resetting an empty buffer is a no-op, so skip the in_waiting probe
+            self.ser.reset_input_buffer()
             self.ser.reset_output_buffer()
 
-            time.sleep(0.5)
             self._initialize_busy_pin()
+            self._wait_ready(0.5)
             self._initialize_printer()
 
         except serial.SerialException as e:
@@ -203,6 +467,29 @@ class PrinterDriver:
             logger.debug("Printer busy pin read failed", exc_info=True)
             return None
 
+    def _wait_ready(self, timeout: float, min_wait: float = 0.05):
+        """Let the printer settle for up to `timeout` seconds after opening the port.
+
+        With the busy pin available this returns as soon as the printer reports
+        ready (after `min_wait`); without it, it is a plain `timeout` sleep.
+        """
+        deadline = time.time() + timeout
+        if self._read_busy_pin() is None:
+            time.sleep(timeout)
+            return
+
+        time.sleep(min_wait)
+        while True:
+            level = self._read_busy_pin()
+            remaining = deadline - time.time()
+            if level == 0 or remaining <= 0:
+                return
+            if level is None:
+                # Pin read failed mid-wait; fall back to the fixed settle
+                time.sleep(remaining)
+                return
+            time.sleep(min(0.02, remaining))
+
     def _load_font_family(self) -> dict:
         """Load IBM Plex Mono font family with multiple weights.
 
@@ -210,7 +497,15 @@ class PrinterDriver:
         Place font files in: web/public/fonts/IBM_Plex_Mono/
         Required files: IBMPlexMono-Medium.ttf (used as base), IBMPlexMono-SemiBold.ttf, IBMPlexMono-Bold.ttf
         Uses Medium as base weight, SemiBold and Bold for headings.
+
+        The loaded family is shared by every driver with the same font size
+        (reconnects, re-inits), since parsing the TTFs is the slow part of
+        construction. Callers only read from it.
         """
+        cached = PrinterDriver._font_cache.get(self.font_size)
+        if cached is not None:
+            return cached
+
         # Get the project root directory (parent of app/)
         app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         project_root = os.path.dirname(app_dir)
@@ -362,12 +657,47 @@ class PrinterDriver:
             except Exception:
                 pass
 
+        PrinterDriver._font_cache[self.font_size] = fonts
         return fonts
 
     def _get_font(self, style: str = "regular") -> ImageFont.FreeTypeFont:
         """Get a font by style name."""
         return self._fonts.get(style, self._fonts.get("regular"))
 
+    def _get_text_measurer(self, font: Optional[ImageFont.FreeTypeFont]) -> Callable[[str], float]:
+        """Get the width-measuring function for a font.
+
+        Cached per font: wrapping measures every word (and every character of
+        over-long words) of every paragraph, so the PIL capability check is
+        resolved once instead of on each wrap or measurement.
+        """
+        measure = self._text_measurers.get(font)
+        if measure is None:
+            measure = self._make_text_measurer(font)
+            self._text_measurers[font] = measure
+        return measure
+
+    def _make_text_measurer(self, font: Optional[ImageFont.FreeTypeFont]) -> Callable[[str], float]:
+        """Pick the width-measuring strategy for a font."""
+        if font is None:
+            return lambda text: len(text) * self.font_size * 0.6
+
+        if hasattr(font, "getbbox"):
+            # Use getbbox for accurate measurement (PIL 8.0+)
+            def measure(text: str) -> float:
+                bbox = font.getbbox(text)
+                return bbox[2] - bbox[0] if bbox else 0
+
+            return measure
+
+        if hasattr(font, "getlength"):
+            # Fallback for older PIL versions
+            return font.getlength
+
+        # Ultimate fallback: estimate based on character count
+        char_width = (font.size if hasattr(font, "size") else self.font_size) * 0.6
+        return lambda text: len(text) * char_width
+
     def _wrap_text_by_width(
         self, text: str, font: ImageFont.FreeTypeFont, max_width_pixels: int
     ) -> List[str]:
@@ -379,13 +709,20 @@ class PrinterDriver:
             max_width_pixels: Maximum width in pixels (accounting for margins)
 
         Returns:
-            List of wrapped lines
+            List of wrapped lines (cached: both render passes wrap every
+            paragraph, so callers must not modify it)
         """
         if not text:
             return []
 
+        key = (text, font, max_width_pixels)
+        cached = self._wrap_cache.get(key)
+        if cached is not None:
+            return cached
+
         # Account for left margin (2px) and right margin (2px)
         available_width = max_width_pixels - 4
+        measure = self._get_text_measurer(font)
 
         lines = []
         words = text.split()
@@ -395,82 +732,20 @@ class PrinterDriver:
             # Test if adding this word fits
             test_line = current_line + (" " if current_line else "") + word
 
-            # Measure text width using font metrics
-            if font:
-                try:
-                    # Use getbbox for accurate measurement (PIL 8.0+)
-                    bbox = font.getbbox(test_line)
-                    text_width = bbox[2] - bbox[0] if bbox else 0
-                except AttributeError:
-                    # Fallback for older PIL versions
-                    try:
-                        text_width = font.getlength(test_line)
-                    except AttributeError:
-                        # Ultimate fallback: estimate based on character count
-                        text_width = (
-                            len(test_line)
-                            * (font.size if hasattr(font, "size") else self.font_size)
-                            * 0.6
-                        )
-            else:
-                # No font: estimate based on character count
-                text_width = len(test_line) * self.font_size * 0.6
-
-            if text_width <= available_width:
+            if measure(test_line) <= available_width:
                 current_line = test_line
             else:
                 # Current line is full, start new line
                 if current_line:
                     lines.append(current_line)
 
-                # Measure word width to decide if we need to break it
-                if font:
-                    try:
-                        bbox = font.getbbox(word)
-                        word_width = bbox[2] - bbox[0] if bbox else 0
-                    except AttributeError:
-                        try:
-                            word_width = font.getlength(word)
-                        except AttributeError:
-                            word_width = (
-                                len(word)
-                                * (
-                                    font.size
-                                    if hasattr(font, "size")
-                                    else self.font_size
-                                )
-                                * 0.6
-                            )
-                else:
-                    word_width = len(word) * self.font_size * 0.6
-
                 # Only break words if they're longer than a full line (like URLs)
-                if word_width > available_width:
+                if measure(word) > available_width:
                     # Word is too long for even a single line, break it character by character
                     current_word = ""
                     for char in word:
                         test_char = current_word + char
-                        if font:
-                            try:
-                                bbox = font.getbbox(test_char)
-                                char_width = bbox[2] - bbox[0] if bbox else 0
-                            except AttributeError:
-                                try:
-                                    char_width = font.getlength(test_char)
-                                except AttributeError:
-                                    char_width = (
-                                        len(test_char)
-                                        * (
-                                            font.size
-                                            if hasattr(font, "size")
-                                            else self.font_size
-                                        )
-                                        * 0.6
-                                    )
-                        else:
-                            char_width = len(test_char) * self.font_size * 0.6
-
-                        if char_width <= available_width:
+                        if measure(test_char) <= available_width:
                             current_word = test_char
                         else:
                             if current_word:
@@ -484,25 +759,49 @@ class PrinterDriver:
         if current_line:
             lines.append(current_line)
 
-        return lines if lines else [""]
+        if not lines:
+            lines = [""]
+        if len(self._wrap_cache) >= self.WRAP_CACHE_SIZE:
+            self._wrap_cache.clear()
+        self._wrap_cache[key] = lines
+        return lines
 
 
 
     def _get_line_height_for_style(self, style: str) -> int:
-        """Get the line height for a given font style."""
+        """Get the line height for a given font style.
+
+        Cached per style: the fonts are fixed once loaded and every styled line
+        asks for this in both render passes.
+        """
+        height = self._line_heights.get(style)
+        if height is not None:
+            return height
+
         font = self._get_font(style)
         if font and hasattr(font, "size"):
-            return font.size + self.line_spacing
+            height = font.size + self.line_spacing
         # Estimate based on style name
-        if "_lg" in style:
-            return self.font_size + 6 + self.line_spacing
+        elif "_lg" in style:
+            height = self.font_size + 6 + self.line_spacing
         elif "_sm" in style:
-            return max(14, self.font_size - 3) + self.line_spacing
-        return self.line_height
+            height = max(14, self.font_size - 3) + self.line_spacing
+        else:
+            height = self.line_height
+        self._line_heights[style] = height
+        return height
+
+    def _get_left_margin(self, selection_active: Optional[bool] = None) -> int:
+        """Get the left margin, which increases when in selection mode.
 
-    def _get_left_margin(self) -> int:
-        """Get the left margin, which increases when in selection mode."""
-        if app.selection_mode.is_selection_mode_active():
+        Pass selection_active to use an already-read selection mode state
+        instead of checking it again.
+        """
+        if self._render_left_margin is not None:
+            return self._render_left_margin
+        if selection_active is None:
+            selection_active = app.selection_mode.is_selection_mode_active()
+        if selection_active:
             # 2px dashed line + 6px gap + 2px standard margin
             return 10
         return 2
@@ -525,7 +824,7 @@ class PrinterDriver:
         elif op_type == "box":
             return self._render_op_box(img, draw, y, op_data, dry_run)
         elif op_type == "icon":
-            return self._render_op_icon(draw, y, op_data, dry_run)
+            return self._render_op_icon(img, y, op_data, dry_run)
         elif op_type == "image":
             return self._render_op_image(img, y, op_data, dry_run)
         elif op_type == "article_block":
@@ -538,7 +837,8 @@ class PrinterDriver:
         return (0, 0)
 
     def _render_op_styled(self, draw: ImageDraw.Draw, y: int, op_data: dict, dry_run: bool) -> tuple[int, int]:
-        clean_text = self._sanitize_text(op_data["text"])
+        # Already sanitized by print_text when buffered
+        clean_text = op_data["text"]
         style = op_data.get("style", "regular")
         font = self._get_font(style)
         line_height = self._get_line_height_for_style(style)
@@ -653,7 +953,7 @@ class PrinterDriver:
             if icon_type:
                 icon_x = content_start_x
                 icon_y = content_y + (text_height - icon_size) // 2
-                self._draw_icon(draw, icon_x, icon_y, icon_type, icon_size)
+                self._draw_icon(img, icon_x, icon_y, icon_type, icon_size)
 
             text_x = (
                 content_start_x + icon_size + icon_spacing
@@ -669,16 +969,16 @@ class PrinterDriver:
         # 2px margin top + box height
         return (2 + box_height, self.SPACING_MEDIUM)
 
-    def _render_op_icon(self, draw: ImageDraw.Draw, y: int, op_data: dict, dry_run: bool) -> tuple[int, int]:
+    def _render_op_icon(self, img: Image.Image, y: int, op_data: dict, dry_run: bool) -> tuple[int, int]:
         icon_type = op_data.get("type", "sun")
         size = op_data.get("size", 32)
         
-        if not dry_run and draw:
+        if not dry_run and img:
             # Center within content area
             icon_x = self._get_left_margin() + (self._get_content_width() - size) // 2
             # SPACING_SMALL top margin
             icon_y = y + self.SPACING_SMALL
-            self._draw_icon(draw, icon_x, icon_y, icon_type, size)
+            self._draw_icon(img, icon_x, icon_y, icon_type, size)
             
         # Top margin + icon size
         return (self.SPACING_SMALL + size, self.SPACING_SMALL)
@@ -835,41 +1135,47 @@ class PrinterDriver:
         Refactored to use a 2-pass system with dry-run capabilities
         to ensure height calculation perfectly matches drawing.
         """
-        import qrcode as qr_lib
-
         if not ops:
             return None
 
-        # Pass 1: Measure
-        measured_content_height = 0
-        last_spacing = 0
-        for op_type, op_data in ops:
-             h, s = self._render_op(None, None, 0, op_type, op_data, dry_run=True)
-             if h > 0:
-                 measured_content_height += h + s
-                 last_spacing = s
-             
-        # Remove trailing spacing
-        measured_content_height -= last_spacing
-        
-        # Content-only bitmap height. Cutter feed is now applied explicitly
-        # after bitmap transmission for more consistent behavior across printers.
-        total_height = measured_content_height + (self.SPACING_LARGE * 2)
-        
-        # Create Image
-        width = self.PRINTER_WIDTH_DOTS
-        img = Image.new("1", (width, total_height), 1)
-        draw = ImageDraw.Draw(img)
-        
-        # Pass 2: Draw content from top (y=0); bottom = white = tear-edge clearance
-        current_y = 0
-        for op_type, op_data in ops:
-             h, s = self._render_op(img, draw, current_y, op_type, op_data, dry_run=False)
-             if h > 0:
-                 current_y += h + s
-        
+        # Check selection mode once: every op asks for the margin (under the
+        # selection lock), and both passes must lay out with the same one.
+        selection_active = app.selection_mode.is_selection_mode_active()
+        self._render_left_margin = self._get_left_margin(selection_active)
+        render_op = self._render_op
+        try:
+            # Pass 1: Measure
+            measured_content_height = 0
+            last_spacing = 0
+            for op_type, op_data in ops:
+                 h, s = render_op(None, None, 0, op_type, op_data, dry_run=True)
+                 if h > 0:
+                     measured_content_height += h + s
+                     last_spacing = s
+
+            # Remove trailing spacing
+            measured_content_height -= last_spacing
+
+            # Content-only bitmap height. Cutter feed is now applied explicitly
+            # after bitmap transmission for more consistent behavior across printers.
+            total_height = measured_content_height + (self.SPACING_LARGE * 2)
+
+            # Create Image
+            width = self.PRINTER_WIDTH_DOTS
+            img = Image.new("1", (width, total_height), 1)
+            draw = ImageDraw.Draw(img)
+
+            # Pass 2: Draw content from top (y=0); bottom = white = tear-edge clearance
+            current_y = 0
+            for op_type, op_data in ops:
+                 h, s = render_op(img, draw, current_y, op_type, op_data, dry_run=False)
+                 if h > 0:
+                     current_y += h + s
+        finally:
+            self._render_left_margin = None
+
         # Draw Selection Mode Visual Indicator
-        if app.selection_mode.is_selection_mode_active():
+        if selection_active:
             # Draw a thin dashed line along the left side
             # 2px wide, dashed
             
@@ -886,14 +1192,15 @@ class PrinterDriver:
                         fill=0
                     )
 
-        # Rotate
-        img = img.rotate(180)
+        # Rotate (a transpose is a straight pixel reorder; rotate() would go
+        # through the generic affine path for arbitrary angles)
+        img = img.transpose(Image.Transpose.ROTATE_180)
         return img
 
 
 
     def _draw_icon(
-        self, draw: ImageDraw.Draw, x: int, y: int, icon_type: str, size: int
+        self, img: Image.Image, x: int, y: int, icon_type: str, size: int
     ):
         """Draw an icon bitmap, loading from PNG files in icons/regular folder only.
 
@@ -901,111 +1208,23 @@ class PrinterDriver:
         the function returns early without drawing anything.
 
         Args:
-            draw: ImageDraw object
+            img: Image to draw onto
             x, y: Top-left corner
             icon_type: Type of icon (sun, cloud, rain, snow, storm, etc.)
             size: Icon size in pixels
         """
-        # Map icon names to Phosphor icon file names
-        icon_aliases = {
-            # Common aliases
-            "mail": "envelope",
-            "email": "envelope",
-            "time": "clock",
-            "settings": "gear",
-            "location": "map-pin",
-            "pin": "map-pin",
-            "home": "house",
-            "menu": "list",
-            "search": "magnifying-glass",
-            "magnifying-glass": "magnifying-glass",
-            "magnifying_glass": "magnifying-glass",
-            "save": "floppy-disk",
-            "floppy": "floppy-disk",
-            "checkmark": "check",
-            "check": "check",
-            "close": "x",
-            "delete": "trash",
-            "refresh": "arrows-clockwise",
-            "clear": "sun",
-            "note-pencil": "note-pencil",
-            "note": "note-pencil",
-            "calendar-blank": "calendar-blank",
-            "calendar": "calendar-blank",
-            "envelope-open": "envelope-open",
-            "cloud-sun": "cloud-sun",
-            "moon-stars": "moon-stars",
-            "grid-nine": "grid-nine",
-            "path": "path",
-            "hourglass": "hourglass",
-            "check-square": "check-square",
-            "desktop": "desktop",
-            "quotes": "quotes",
-            "plugs": "plugs",
-            "newspaper": "newspaper",
-            "rss": "rss",
-            "arrow_right": "arrow-right",
-            "wifi": "wifi-high",
-            # Weather icons
-            "rain": "cloud-rain",
-            "snow": "cloud-snow",
-            "snowflake": "snowflake",
-            "storm": "cloud-lightning",
-            "thunder": "cloud-lightning",
-            "lightning": "cloud-lightning",
-            "cloud-fog": "cloud-fog",
-            "fog": "cloud-fog",
-            "mist": "cloud-fog",
-            "cloud-moon": "cloud-moon",
-            "sun-horizon": "sun-horizon",
-            "thermometer": "thermometer",
-            "thermometer-hot": "thermometer-hot",
-            "thermometer-cold": "thermometer-cold",
-            "wind": "wind",
-            "rainbow": "rainbow",
-            "rainbow-cloud": "rainbow-cloud",
-        }
-
         # Use mapped alias or original icon name
-        file_name = icon_aliases.get(icon_type.lower(), icon_type.lower())
+        file_name = _ICON_ALIASES.get(icon_type.lower(), icon_type.lower())
 
-        # Try to load PNG from icons/regular directory
-        # Get project root (go up from app/drivers/ to app/, then up to project root)
-        app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))  # app/
-        project_root = os.path.dirname(app_dir)  # project root
-        icon_path = os.path.join(project_root, "icons", "regular", f"{file_name}.png")
-
-        if os.path.exists(icon_path):
-            try:
-                icon_img = Image.open(icon_path)
-                # Resize if needed
-                if icon_img.size != (size, size):
-                    icon_img = icon_img.resize((size, size), Image.NEAREST)
-
-                # Convert to 1-bit if not already
-                if icon_img.mode != "1":
-                    icon_img = icon_img.convert("1")
-
-                # Draw pixels onto the main image
-                # We need to access the underlying image from ImageDraw
-                # ImageDraw has a private `_image` attribute, but safer to use `draw.im`
-                # Actually, we can iterate pixels and draw them
-                width, height = icon_img.size
-                pixels = icon_img.load()
-                for py in range(height):
-                    for px in range(width):
-                        # In PIL '1' mode: 0=black, 1=white
-                        # We want to draw black pixels (0) onto white background
-                        pixel = pixels[px, py]
-                        if pixel == 0:
-                            draw.point((x + px, y + py), fill=0)
-
-                return  # Successfully drew from file
-            except Exception:
-                return  # Failed to load, skip icon
+        icon_mask = _load_icon(file_name, size)
+        if icon_mask is None:
+            # PNG file doesn't exist or failed to load - skip (no programmatic fallback)
+            return
 
-        # PNG file doesn't exist - skip (no programmatic fallback)
-        return
+        # Paste black through the icon's ink mask: white icon pixels leave the
+        # canvas untouched, and parts hanging off the canvas are clipped
+        width, height = icon_mask.size
+        img.paste(0, (x, y, x + width, y + height), icon_mask)
 
 
 
@@ -1023,48 +1242,11 @@ class PrinterDriver:
             size: Target size in pixels (used when fixed_size=True)
             error_correction: L/M/Q/H
             fixed_size: If True, resize output to consistent dimensions
-        """
-        if not data:
-            return None
 
-        try:
-            import qrcode
-
-            ec_map = {
-                "L": qrcode.constants.ERROR_CORRECT_L,
-                "M": qrcode.constants.ERROR_CORRECT_M,
-                "Q": qrcode.constants.ERROR_CORRECT_Q,
-                "H": qrcode.constants.ERROR_CORRECT_H,
-            }
-            ec_level = ec_map.get(
-                error_correction.upper(), qrcode.constants.ERROR_CORRECT_L
-            )
-
-            # Use version 1 and let it auto-fit, then resize for consistency
-            # Generate at higher resolution (box_size) for better quality when scaling
-            box_size = max(size, 8) if fixed_size else size
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=ec_level,
-                box_size=box_size,
-                border=1,
-            )
-            qr.add_data(data)
-            qr.make(fit=True)
-
-            qr_img = qr.make_image(fill_color="black", back_color="white")
-            qr_img = qr_img.convert("1")
-
-            # If fixed_size, resize all QR codes to the same dimensions
-            if fixed_size:
-                # Target size: 80x80 pixels for consistent appearance (for standalone QR codes)
-                target_size = 80
-                # Use LANCZOS for better quality when scaling
-                qr_img = qr_img.resize((target_size, target_size), Image.LANCZOS)
-
-            return qr_img
-        except Exception:
-            return None
+        Returns None if there is no data or encoding fails. The image is
+        shared with later calls for the same QR, so callers must not modify it.
+        """
+        return _make_qr_image(data, size, error_correction, fixed_size)
 
     def _send_bitmap(self, img: Image.Image):
         """Send a bitmap image to the printer using GS v 0 raster command.
@@ -1100,30 +1282,23 @@ class PrinterDriver:
             yL = height & 0xFF
             yH = (height >> 8) & 0xFF
 
-            # Pre-allocate the complete command buffer
-            # Header (8 bytes) + raster data
-            command = bytearray(8 + len(pixels))
-            command[0:4] = b"\x1d\x76\x30\x00"  # GS v 0 command
-            command[4:8] = bytes([xL, xH, yL, yH])
-
             # PIL 1-bit mode: 0 = black, 255 = white (packed into bytes)
             # Printer expects: 1 = black dot, 0 = white
             # PIL packs 8 pixels per byte, MSB first, but inverted from what printer expects
             # So we need to invert the bytes
-            for i, byte in enumerate(pixels):
-                command[8 + i] = byte ^ 0xFF  # Invert bits
+            # Header (8 bytes) + raster data
+            command = (
+                b"\x1d\x76\x30\x00"  # GS v 0 command
+                + bytes([xL, xH, yL, yH])
+                + pixels.translate(_INVERT_BITS)
+            )
 
-            # Send entire image in chunks to prevent buffer overflow
+            # Send the whole command in one write. pyserial's write() blocks
+            # until the OS has accepted every byte, so chunking with sleeps
+            # only added syscalls and ~10ms per 4KB without pacing the printer.
             logger.debug("Sending bitmap: %dx%d (%d bytes)", width, height, len(command))
-            CHUNK_SIZE = 4096
-            total_sent = 0
-            for i in range(0, len(command), CHUNK_SIZE):
-                chunk = command[i : i + CHUNK_SIZE]
-                self._write(bytes(chunk))
-                total_sent += len(chunk)
-                # Small yield to let hardware buffer drain slightly
-                time.sleep(0.01)
-            logger.debug("Bitmap send complete. Total bytes: %d", total_sent)
+            self._write(command)
+            logger.debug("Bitmap send complete. Total bytes: %d", len(command))
 
 
         except Exception:
@@ -1141,18 +1316,34 @@ class PrinterDriver:
                     # Write all data at once - don't flush() as that blocks
                     # until all bytes transmit (slow at 9600 baud)
                     self.ser.write(data)
-        except Exception:
-            logger.exception("Serial write failed")
+            self._write_failing = False
+        except Exception as e:
+            if self._write_failing:
+                logger.debug("Serial write failed again: %s", e)
+            else:
+                self._write_failing = True
+                logger.warning("Serial write failed: %s", e, exc_info=True)
+
+    def _flush(self):
+        """Block until everything written so far has left the port (tcdrain).
+
+        _write never drains, so callers do this once at the end of a job or
+        feed rather than after each command.
+        """
+        with self._io_lock:
+            if self.ser and self.ser.is_open:
+                self.ser.flush()
 
     def _read(self, size: int = 1, timeout: float = 1.0) -> bytes:
         """Read bytes from serial interface. Returns empty bytes on error."""
         try:
             if self.ser and self.ser.is_open:
-                old_timeout = self.ser.timeout
-                self.ser.timeout = timeout
-                data = self.ser.read(size)
-                self.ser.timeout = old_timeout
-                return data
+                # Setting the timeout reconfigures the port (tcsetattr), so
+                # only touch it when it changes. Nothing else reads with the
+                # port timeout, so it is left at the last value.
+                if self.ser.timeout != timeout:
+                    self.ser.timeout = timeout
+                return self.ser.read(size)
         except Exception:
             pass
         return b""
@@ -1233,6 +1424,10 @@ class PrinterDriver:
             return
 
     def close(self):
+        """Close the serial connection and release the busy-pin GPIO line.
+
+        Safe to call more than once; released handles are cleared.
+        """
         if self._busy_handle:
             try:
                 self._busy_handle.close()
@@ -1254,8 +1449,6 @@ class PrinterDriver:
 
     def clear_hardware_buffer(self):
         """Clear the printer's hardware buffer - call at startup to prevent garbage."""
-        import time
-
         try:
             with self._io_lock:
                 # Clear software buffer
@@ -1279,14 +1472,12 @@ class PrinterDriver:
     def _apply_ascii_settings(self):
         """Apply ASCII-only mode settings for bitmap rendering."""
         try:
-            # Cancel Chinese character mode (confirmed in QR204 manual)
-            self._write(b"\x1c\x2e")  # FS . (1C 2E) - Cancel Chinese mode
-
-            # Select USA character set (confirmed in QR204 manual)
-            self._write(b"\x1b\x52\x00")  # ESC R 0 (1B 52 00) - USA character set
-
-            # Select code page PC437 (confirmed in QR204 manual)
-            self._write(b"\x1b\x74\x00")  # ESC t 0 (1B 74 00) - Code page PC437 (US)
+            # No timing dependency between these, so send them as one write.
+            self._write(
+                b"\x1c\x2e"  # FS . (1C 2E) - Cancel Chinese mode (QR204 manual)
+                b"\x1b\x52\x00"  # ESC R 0 (1B 52 00) - USA character set (QR204 manual)
+                b"\x1b\x74\x00"  # ESC t 0 (1B 74 00) - Code page PC437 (US) (QR204 manual)
+            )
 
             # Note: No ESC { rotation needed - we rotate bitmaps in software
         except Exception:
@@ -1294,15 +1485,11 @@ class PrinterDriver:
 
     def _initialize_printer(self):
         """Send initialization commands to ensure ASCII-only mode."""
-        import time
-
         try:
-            # Clear any garbage in the printer buffer
-            self._write(b"\x00\x00\x00\x00\x00")
-            time.sleep(0.1)
-
-            # ESC @ - Hardware reset (clears all settings)
-            self._write(b"\x1b\x40")
+            # Clear any garbage in the printer buffer with NULs, then
+            # ESC @ - Hardware reset (clears all settings). The NULs are
+            # no-ops to the printer, so both go out in one write.
+            self._write(b"\x00\x00\x00\x00\x00" b"\x1b\x40")
             time.sleep(0.3)
 
             # Apply ASCII settings
@@ -1324,23 +1511,7 @@ class PrinterDriver:
         Convert text to pure ASCII to prevent Chinese character issues.
         Replaces common Unicode chars with ASCII equivalents.
         """
-        # Step 1: Apply known character replacements
-        text = text.translate(self.CHAR_REPLACEMENTS)
-
-        # Step 2: Normalize Unicode (decompose accented chars like é -> e + accent)
-        text = unicodedata.normalize("NFKD", text)
-
-        # Step 3: Keep only printable ASCII (0x20-0x7E) plus newline/tab
-        result = []
-        for char in text:
-            code = ord(char)
-            if 0x20 <= code <= 0x7E:  # Printable ASCII
-                result.append(char)
-            elif char in "\n\r\t":  # Whitespace
-                result.append(char)
-            # Skip everything else
-
-        return "".join(result)
+        return _sanitize_ascii(text)
 
 
 
@@ -1371,18 +1542,32 @@ class PrinterDriver:
         """
         if not text:
             return
+        self.print_lines([text], style)
+
+    def print_lines(self, lines: Iterable[str], style: str = "regular"):
+        """Print several lines of text in one style.
+
+        Same as calling print_text for each line, but the lines are
+        sanitized together in one pass. Empty strings are kept as blank lines.
+        """
+        lines = list(lines)
+        if not lines:
+            return
 
-        # Split by newlines to handle multi-line text properly
+        # Sanitize once here rather than in both render passes, then split
+        # by newlines to handle multi-line text properly.
         # Empty lines are preserved as blank lines for spacing
-        lines = text.split("\n")
+        lines = self._sanitize_text("\n".join(lines)).split("\n")
 
-        # Safety: prevent unbounded buffer growth
+        buffer = self.print_buffer
         for line in lines:
-            if len(self.print_buffer) >= self.MAX_BUFFER_SIZE:
+            # Safety: prevent unbounded buffer growth (flushing swaps in a
+            # fresh buffer list)
+            if len(buffer) >= self.MAX_BUFFER_SIZE:
                 self.flush_buffer()
+                buffer = self.print_buffer
             # Buffer each line separately with the same style
-            # Empty strings represent blank lines (preserved for spacing)
-            self.print_buffer.append(("styled", {"text": line, "style": style}))
+            buffer.append(("styled", {"text": line, "style": style}))
 
     def print_header(self, text: str, icon: str = None, icon_size: int = 24):
         """Print large bold header text in a drawn box.
@@ -1424,18 +1609,25 @@ class PrinterDriver:
 
     def print_line(self):
         """Print a single-line ASCII dashed separator that does not wrap."""
-        font = self._get_font("light")
-        available_width = self.PRINTER_WIDTH_DOTS - 4  # keep side margins
+        separator = self._separator
+        if separator is None or separator[0] != self.width:
+            font = self._get_font("light")
+            available_width = self.PRINTER_WIDTH_DOTS - 4  # keep side margins
 
-        try:
-            bbox = font.getbbox("-") if font else None
-            dash_width = (bbox[2] - bbox[0]) if bbox else max(1, self.font_size // 2)
-        except Exception:
-            dash_width = max(1, self.font_size // 2)
+            try:
+                bbox = font.getbbox("-") if font else None
+                dash_width = (bbox[2] - bbox[0]) if bbox else max(1, self.font_size // 2)
+            except Exception:
+                dash_width = max(1, self.font_size // 2)
+
+            dash_count = max(8, int(available_width // max(1, dash_width)))
+            dash_count = min(dash_count, self.width)
+            separator = self._separator = (self.width, "-" * dash_count)
 
-        dash_count = max(8, int(available_width // max(1, dash_width)))
-        dash_count = min(dash_count, self.width)
-        self.print_text("-" * dash_count, "light")
+        # Dashes are plain ASCII, so buffer directly without sanitizing
+        if len(self.print_buffer) >= self.MAX_BUFFER_SIZE:
+            self.flush_buffer()
+        self.print_buffer.append(("styled", {"text": separator[1], "style": "light"}))
 
     def print_article_block(
         self,
@@ -1456,34 +1648,21 @@ class PrinterDriver:
             summary: Article summary/description
             url: URL to encode as QR code
             qr_size: Size of QR code in pixels (default 64)
-            title_width: Characters per line for title wrapping (fallback, uses pixel-based wrapping)
-            summary_width: Characters per line for summary wrapping (fallback, uses pixel-based wrapping)
+            title_width: Unused here (the renderer wraps by pixel width); kept for parity with the mock driver
+            summary_width: Unused here (the renderer wraps by pixel width); kept for parity with the mock driver
             max_summary_lines: Maximum summary lines to show
         """
         if len(self.print_buffer) >= self.MAX_BUFFER_SIZE:
             self.flush_buffer()
 
-        # Wrap title and summary (fallback for pixel-based wrapping in renderer)
-        from app.utils import wrap_text
-
-        title_wrapped = wrap_text(title, width=title_width, indent=0)
-        summary_wrapped = []
-        if summary:
-            summary_wrapped = wrap_text(summary, width=summary_width, indent=0)[
-                :max_summary_lines
-            ]
-
+        # Title and summary are wrapped by pixel width at render time
         article_data = {
             "source": source,
             "title": title,
-            "summary": summary,  # Store raw summary for pixel-based re-wrapping
-            "title_wrapped": title_wrapped,
-            "summary_wrapped": summary_wrapped,
+            "summary": summary,
             "url": url,
             "qr_size": qr_size,
             "max_summary_lines": max_summary_lines,
-            "title_lines": len(title_wrapped),
-            "summary_lines": len(summary_wrapped),
         }
 
         self.print_buffer.append(("article_block", article_data))
@@ -1567,25 +1746,24 @@ class PrinterDriver:
 
 
             # If max_lines is set, trim content from END of buffer
+            # (one pass: find the first op over the limit while totalling
+            # lines for the truncation message)
             total_lines_in_buffer = 0
             if self.max_lines > 0:
-                for op_type, op_data in self.print_buffer:
-                    if op_type == "text":
-                        total_lines_in_buffer += op_data.count("\n") + 1
-
-                lines_counted = 0
-                trim_index = len(self.print_buffer)
+                trim_index = None
 
                 for i, (op_type, op_data) in enumerate(self.print_buffer):
                     if op_type == "text":
                         lines_in_item = op_data.count("\n") + 1
-                        if lines_counted + lines_in_item > self.max_lines:
+                        if (
+                            trim_index is None
+                            and total_lines_in_buffer + lines_in_item > self.max_lines
+                        ):
                             trim_index = i
-                            self._max_lines_hit = True
-                            break
-                        lines_counted += lines_in_item
+                        total_lines_in_buffer += lines_in_item
 
-                if self._max_lines_hit:
+                if trim_index is not None:
+                    self._max_lines_hit = True
                     self.print_buffer = self.print_buffer[:trim_index]
 
             # Add truncation message if needed
@@ -1594,29 +1772,32 @@ class PrinterDriver:
                     ("text", f"-- TRUNCATED ({self.max_lines}/{total_lines_in_buffer}) --")
                 )
 
-            # Render everything as one unified bitmap
-            ops = list(self.print_buffer)
-            self.print_buffer.clear()
+            # Render everything as one unified bitmap. Swap in a fresh buffer
+            # rather than copying the ops list and clearing it.
+            ops = self.print_buffer
+            self.print_buffer = []
 
             img = self._render_unified_bitmap(ops)
             if img:
                 logger.debug("Rendered unified bitmap: %s", img.size)
                 self._send_bitmap(img)
-                # Ensure all data is transmitted before returning
-                if self.ser and self.ser.is_open:
-                    try:
-                        self.ser.flush()
-                    except Exception:
-                        logger.exception("Serial flush failed")
                 # Explicit post-print feed for cutter clearance.
                 # Use feed_direct() because it sends both ESC d and ESC J variants
                 # for better compatibility across printer firmwares.
                 feed_lines = max(0, int(self.cutter_feed_dots / 24))
                 if feed_lines > 0:
+                    # The feed queues behind the bitmap and feed_direct() drains
+                    # the port afterwards, so the receipt is drained only once.
                     try:
                         self.feed_direct(feed_lines)
                     except Exception:
                         logger.exception("Post-print feed failed")
+                else:
+                    # Ensure all data is transmitted before returning
+                    try:
+                        self._flush()
+                    except Exception:
+                        logger.exception("Serial flush failed")
                 self.wait_for_idle()
             else:
                 logger.debug("No bitmap rendered from ops.")
@@ -1660,18 +1841,13 @@ class PrinterDriver:
             # This command works after bitmap printing because it's a "print and feed" command
             # Even with no data to print, it should still feed the paper
             feed_amount = min(lines, 255)
-            self._write(b"\x1b\x64" + bytes([feed_amount]))
 
-            # Backup: Also send ESC J (feed by dots) in case ESC d doesn't work
-            dots = lines * 24
-            while dots > 0:
-                chunk = min(dots, 255)
-                self._write(b"\x1b\x4a" + bytes([chunk]))
-                dots -= chunk
+            # Backup: Also send ESC J (feed by dots) in case ESC d doesn't work.
+            # Both go out in a single write.
+            self._write(_ESC_D_CMD[feed_amount] + _esc_j_feed(lines * 24))
 
             # Flush to ensure all data is sent
-            if self.ser and self.ser.is_open:
-                self.ser.flush()
+            self._flush()
         except Exception:
             pass
 
@@ -1679,14 +1855,9 @@ class PrinterDriver:
         """Feed paper by raw dot count (12 dots ~= half line)."""
         if dots <= 0:
             return
-        remaining = int(dots)
         try:
-            while remaining > 0:
-                chunk = min(remaining, 255)
-                self._write(b"\x1b\x4a" + bytes([chunk]))  # ESC J n
-                remaining -= chunk
-            if self.ser and self.ser.is_open:
-                self.ser.flush()
+            self._write(_esc_j_feed(int(dots)))  # ESC J n
+            self._flush()
         except Exception:
             pass
 
@@ -1728,10 +1899,3 @@ class PrinterDriver:
                 },
             )
         )
-
-
-
-    def close(self):
-        """Close the serial connection."""
-        if self.ser and self.ser.is_open:
-            self.ser.close()
@@ -313,7 +313,6 @@ def _expire_stale_hold_action_locked(current_time: float):
 def _try_begin_print_job(*, debounce: bool = False) -> bool:
     """Reserve the printer for a new print job."""
     global print_in_progress, last_print_time
-    import time
 
     with print_lock:
         current_time = time.time()
@@ -333,7 +332,6 @@ def _try_begin_print_job(*, debounce: bool = False) -> bool:
 def _reserve_hold_action() -> bool:
     """Reserve the printer once the user crosses a long-hold threshold."""
     global hold_action_in_progress, hold_action_started_at, last_print_time
-    import time
 
     with print_lock:
         current_time = time.time()
@@ -351,7 +349,6 @@ def _reserve_hold_action() -> bool:
 def _promote_hold_to_print_job() -> bool:
     """Convert a hold reservation into an active print job."""
     global print_in_progress, hold_action_in_progress, hold_action_started_at, last_print_time
-    import time
 
     with print_lock:
         current_time = time.time()
@@ -370,7 +367,6 @@ def _promote_hold_to_print_job() -> bool:
 def _clear_print_reservation(*, clear_hold: bool = True):
     """Release active print/hold reservations."""
     global print_in_progress, hold_action_in_progress, hold_action_started_at, last_print_time
-    import time
 
     with print_lock:
         if print_in_progress:
@@ -3655,7 +3651,6 @@ async def search_location(q: str, limit: int = 20, use_api: Optional[str] = None
     if use_api_enabled:
         try:
             import requests
-            import time
             from concurrent.futures import ThreadPoolExecutor
 
             # Use Nominatim API (free, no API key required)
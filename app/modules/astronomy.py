@@ -1,11 +1,12 @@
 from datetime import datetime, timedelta
 import pytz
 import math
+import functools
 from astral import LocationInfo
 from astral.sun import sun, zenith_and_azimuth
 from astral.moon import phase
 from typing import Dict, Any, List, Tuple
-from PIL import Image, ImageDraw
+from PIL import Image, ImageChops, ImageDraw
 
 import app.config
 from app.config import format_print_datetime, format_time
@@ -119,6 +120,35 @@ def get_almanac_data():
         "day_length": f"{day_hours}h {day_minutes:02d}m"
     }
 
+# 8x8 Bayer matrix for the moon's ordered dither.
+_BAYER_8X8 = [
+    [0, 48, 12, 60, 3, 51, 15, 63],
+    [32, 16, 44, 28, 35, 19, 47, 31],
+    [8, 56, 4, 52, 11, 59, 7, 55],
+    [40, 24, 36, 20, 43, 27, 39, 23],
+    [2, 50, 14, 62, 1, 49, 13, 61],
+    [34, 18, 46, 30, 33, 17, 45, 29],
+    [10, 58, 6, 54, 9, 57, 5, 53],
+    [42, 26, 38, 22, 41, 25, 37, 21],
+]
+_LIT_IF_NONZERO = [0] + [255] * 255
+
+
+@functools.lru_cache(maxsize=8)
+def _bayer_threshold_image(size: int) -> Image.Image:
+    """Grayscale image of per-pixel dither thresholds (0-255), tiled to size."""
+    tile = Image.frombytes(
+        "L",
+        (8, 8),
+        bytes(int(((value + 0.5) / 64.0) * 255) for row in _BAYER_8X8 for value in row),
+    )
+    thresholds = Image.new("L", (size, size))
+    for y in range(0, size, 8):
+        for x in range(0, size, 8):
+            thresholds.paste(tile, (x, y))
+    return thresholds
+
+
 def draw_moon_phase_image(phase: float, size: int) -> Image.Image:
     """Draw a moon phase with textured lunar shading for thermal printers."""
     grayscale = Image.new("L", (size, size), 255)
@@ -146,19 +176,41 @@ def draw_moon_phase_image(phase: float, size: int) -> Image.Image:
         (0.43, -0.20, 0.10, 0.06),
     ]
 
+    shade_surface = illumination >= 0.08
+    dark_base, dark_scale = (62, 16) if illumination < 0.08 else (74, 14)
+
+    # Per-column terms (nx, nx^2, x half of each albedo feature's squared
+    # distance) are the same on every row, so work them out once.
+    columns = {}
+    for px in range(center_x - radius, center_x + radius + 1):
+        nx = (px - center_x) / radius
+        columns[px] = (
+            nx,
+            nx * nx,
+            [(nx - maria_x) * (nx - maria_x) for maria_x, _, _, _ in maria],
+            (nx + 0.20) ** 2,
+        )
+
     for py in range(center_y - radius, center_y + radius + 1):
         ny = (py - center_y) / radius
         ny_sq = ny * ny
         if ny_sq > 1:
             continue
 
+        # Likewise the y half of each albedo feature's distance for the row.
+        row_maria = [
+            ((ny - maria_y) * (ny - maria_y), 2 * sigma * sigma, depth)
+            for _, maria_y, sigma, depth in maria
+        ]
+        highlands_dy_sq = (ny - 0.34) ** 2
+
         row_half_width = math.sqrt(1 - ny_sq)
         row_x_min = max(center_x - radius, int(math.ceil(center_x - row_half_width * radius)))
         row_x_max = min(center_x + radius, int(math.floor(center_x + row_half_width * radius)))
 
         for px in range(row_x_min, row_x_max + 1):
-            nx = (px - center_x) / radius
-            nz_sq = 1 - nx * nx - ny_sq
+            nx, nx_sq, maria_dx_sq, highlands_dx_sq = columns[px]
+            nz_sq = 1 - nx_sq - ny_sq
             if nz_sq < 0:
                 continue
             nz = math.sqrt(nz_sq)
@@ -167,10 +219,7 @@ def draw_moon_phase_image(phase: float, size: int) -> Image.Image:
 
             if dot <= 0:
                 # Avoid heavy solid-black fill to reduce thermal print banding.
-                if illumination < 0.08:
-                    intensity = 62 + int(16 * nz)
-                else:
-                    intensity = 74 + int(14 * nz)
+                intensity = dark_base + int(dark_scale * nz)
             else:
                 # Lambertian lighting with mild limb darkening.
                 diffuse = dot ** 0.82
@@ -178,37 +227,22 @@ def draw_moon_phase_image(phase: float, size: int) -> Image.Image:
                 intensity = 220 + int(35 * diffuse * limb)
 
                 # Keep near-new moon cleaner with less surface noise.
-                if illumination >= 0.08:
+                if shade_surface:
                     # Apply deterministic surface albedo features (maria/highlands).
                     albedo = 1.0
-                    for maria_x, maria_y, sigma, depth in maria:
-                        dx = nx - maria_x
-                        dy = ny - maria_y
-                        albedo -= depth * math.exp(-(dx * dx + dy * dy) / (2 * sigma * sigma))
-                    highlands = 0.02 * math.exp(-(((nx + 0.20) ** 2) + ((ny - 0.34) ** 2)) / (2 * 0.11 * 0.11))
+                    for dx_sq, (dy_sq, two_sigma_sq, depth) in zip(maria_dx_sq, row_maria):
+                        albedo -= depth * math.exp(-(dx_sq + dy_sq) / two_sigma_sq)
+                    highlands = 0.02 * math.exp(-(highlands_dx_sq + highlands_dy_sq) / (2 * 0.11 * 0.11))
                     albedo = max(0.82, min(1.04, albedo + highlands))
                     intensity = int(intensity * albedo)
 
             gray_pixels[px, py] = max(0, min(255, intensity))
 
     # Ordered dithering creates stable grain and fewer dense black streaks.
-    image = Image.new("1", (size, size), 1)
-    pixels = image.load()
-    bayer_8x8 = [
-        [0, 48, 12, 60, 3, 51, 15, 63],
-        [32, 16, 44, 28, 35, 19, 47, 31],
-        [8, 56, 4, 52, 11, 59, 7, 55],
-        [40, 24, 36, 20, 43, 27, 39, 23],
-        [2, 50, 14, 62, 1, 49, 13, 61],
-        [34, 18, 46, 30, 33, 17, 45, 29],
-        [10, 58, 6, 54, 9, 57, 5, 53],
-        [42, 26, 38, 22, 41, 25, 37, 21],
-    ]
-    for py in range(size):
-        for px in range(size):
-            level = gray_pixels[px, py]
-            threshold = int(((bayer_8x8[py % 8][px % 8] + 0.5) / 64.0) * 255)
-            pixels[px, py] = 1 if level >= threshold else 0
+    # subtract(..., offset=1) is non-zero exactly where level >= threshold.
+    image = ImageChops.subtract(
+        grayscale, _bayer_threshold_image(size), offset=1
+    ).point(_LIT_IF_NONZERO, "1")
 
     draw = ImageDraw.Draw(image)
     draw.ellipse(
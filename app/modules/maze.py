@@ -1,6 +1,6 @@
 import random
 from typing import Dict, Any, List, Tuple
-from PIL import Image, ImageDraw
+from PIL import Image
 from app.module_registry import register_module
 
 
@@ -226,42 +226,32 @@ def draw_maze_image(grid: List[List[int]], cell_size: int = 8) -> Image.Image:
     width = cols * cell_size
     height = rows * cell_size
     
-    # Create white image (1-bit monochrome)
+    # Create white image (1-bit monochrome); path cells stay white
     image = Image.new("1", (width, height), 1)
-    draw = ImageDraw.Draw(image)
-    
-    # Draw each cell
-    for row_idx, row in enumerate(grid):
-        for col_idx, cell in enumerate(row):
-            cell_x = col_idx * cell_size
-            cell_y = row_idx * cell_size
+    if not width or not height:
+        return image
+
+    # Wall cell - 50% grey checkerboard pattern, black where (px + py) is even
+    # within the cell. Repeat one cell across a row strip, then the strip down
+    # the image, so the pattern restarts at every cell boundary.
+    cell_tile = Image.new("1", (cell_size, cell_size), 1)
+    cell_tile.putdata([0 if (px + py) % 2 == 0 else 1 for py in range(cell_size) for px in range(cell_size)])
+    strip = Image.new("1", (width, cell_size), 1)
+    for cell_x in range(0, width, cell_size):
+        strip.paste(cell_tile, (cell_x, 0))
+    pattern = Image.new("1", (width, height), 1)
+    for cell_y in range(0, height, cell_size):
+        pattern.paste(strip, (0, cell_y))
 
-            if cell == 1:
-                # Wall - draw 50% grey checkerboard pattern
-                for py in range(cell_size):
-                    for px in range(cell_size):
-                        # Checkerboard: black if (px + py) is even
-                        if (px + py) % 2 == 0:
-                            draw.point((cell_x + px, cell_y + py), fill=0)  # Black
-                        else:
-                            draw.point((cell_x + px, cell_y + py), fill=1)  # White
-            else:
-                # Path - draw white rectangle (or leave blank)
-                draw.rectangle(
-                    [
-                        cell_x,
-                        cell_y,
-                        cell_x + cell_size - 1,
-                        cell_y + cell_size - 1,
-                    ],
-                    fill=1,  # White
-                    outline=None,
-                )
+    # One mask pixel per grid cell (walls opaque), scaled up to cell size
+    walls = Image.frombytes(
+        "L", (cols, rows), bytes(255 if cell == 1 else 0 for row in grid for cell in row)
+    ).resize((width, height), Image.NEAREST)
+    image.paste(pattern, (0, 0), walls)
 
     # Entrance and exit markers (arrows) have been removed as requested.
-    # The entrance and exit cells are already drawn as white path cells in the loop above.
+    # The entrance and exit cells are drawn as white path cells like the rest.
 
-            
     return image
 
 
@@ -160,56 +160,39 @@ def draw_sudoku_image(grid: List[List[int]], cell_size: int, font) -> Image.Imag
         [0, 0, total_size - 1, total_size - 1], outline=0, width=border_width
     )
 
-    # Draw grid lines and numbers
+    grid_end = border_width + 9 * cell_size
+
+    # Draw grid lines, each spanning the whole grid. Thin lines follow every
+    # cell's right/bottom edge; the thick 3x3 boundaries go over them (the
+    # outer ones are the border).
+    for i in range(1, 10):
+        offset = border_width + i * cell_size
+        draw.line([offset, border_width, offset, grid_end], fill=0, width=thin_width)
+        draw.line([border_width, offset, grid_end, offset], fill=0, width=thin_width)
+    for i in (3, 6):
+        offset = border_width + i * cell_size
+        draw.line([offset, border_width, offset, grid_end], fill=0, width=border_width)
+        draw.line([border_width, offset, grid_end, offset], fill=0, width=border_width)
+
+    # Only digits 1-9 appear, so measure each one once
+    text_sizes = {}
+    for value in range(1, 10):
+        if font:
+            bbox = font.getbbox(str(value))
+            text_sizes[value] = (bbox[2] - bbox[0], bbox[3] - bbox[1])
+        else:
+            text_sizes[value] = (cell_size // 2, cell_size // 2)
+
+    # Draw numbers
     for row in range(9):
         for col in range(9):
-            cell_x = border_width + col * cell_size
-            cell_y = border_width + row * cell_size
-
-            # Determine boundary widths (thick for 3x3 boundaries)
-            top_width = border_width if row % 3 == 0 else thin_width
-            left_width = border_width if col % 3 == 0 else thin_width
-            
-            # Draw cell borders
-            # Top
-            if row % 3 == 0 and row > 0:
-                 draw.line(
-                    [cell_x, cell_y, cell_x + cell_size, cell_y],
-                    fill=0,
-                    width=top_width,
-                )
-            # Left
-            if col % 3 == 0 and col > 0:
-                draw.line(
-                    [cell_x, cell_y, cell_x, cell_y + cell_size],
-                    fill=0,
-                    width=left_width,
-                )
-            # Right (always draw thin, thick handled by next col's left or outer border)
-            draw.line(
-                [cell_x + cell_size, cell_y, cell_x + cell_size, cell_y + cell_size],
-                fill=0,
-                width=thin_width,
-            )
-            # Bottom (always draw thin, thick handled by next row's top or outer border)
-            draw.line(
-                [cell_x, cell_y + cell_size, cell_x + cell_size, cell_y + cell_size],
-                fill=0,
-                width=thin_width,
-            )
-
-            # Draw number if present
             value = grid[row][col]
             if value != 0:
+                cell_x = border_width + col * cell_size
+                cell_y = border_width + row * cell_size
                 num_str = str(value)
                 # Center text in cell
-                if font:
-                    bbox = font.getbbox(num_str)
-                    text_width = bbox[2] - bbox[0]
-                    text_height = bbox[3] - bbox[1]
-                else:
-                    text_width = cell_size // 2
-                    text_height = cell_size // 2
+                text_width, text_height = text_sizes[value]
 
                 text_x = cell_x + (cell_size - text_width) // 2
                 text_y = cell_y + (cell_size - text_height) // 2
@@ -228,12 +228,18 @@ def draw_progress_bar_image(
         fill_width = 0
 
     # Draw filled portion (checkerboard pattern for visual interest)
-    if fill_width > 0:
-        for px in range(x + 2, x + 2 + fill_width):
-            for py in range(y + 2, y + height - 2):
-                # Checkerboard pattern
-                if ((px - x) + (py - y)) % 4 < 2:
-                    draw.point((px, py), fill=0)
+    fill_height = height - 4
+    if fill_width > 0 and fill_height > 0:
+        # Diagonal stripes, black where (px + py) % 4 < 2 relative to the bar.
+        # Each fill row is a window onto one repeating stripe row, shifted by
+        # the row's phase; the rows become a mask and black is pasted through.
+        stripe = b"\xff\xff\x00\x00" * (fill_width // 4 + 2)
+        rows = [
+            stripe[(py + 2) % 4 : (py + 2) % 4 + fill_width]
+            for py in range(2, 2 + fill_height)
+        ]
+        mask = Image.frombytes("L", (fill_width, fill_height), b"".join(rows))
+        img.paste(0, (x + 2, y + 2, x + 2 + fill_width, y + 2 + fill_height), mask)
 
     # Draw label if provided
     if label and font:
@@ -1,3 +1,4 @@
+import functools
 import os
 import requests
 from collections import Counter
@@ -266,76 +267,70 @@ def _get_icon_type(condition: str) -> str:
         return "cloud"
 
 
-def draw_icon_on_image(draw: ImageDraw.Draw, x: int, y: int, icon_type: str, size: int):
-    """Draw a weather icon onto a PIL ImageDraw context."""
-    icon_aliases = {
-        "clear": "sun",
-        "rain": "cloud-rain",
-        "snow": "cloud-snow",
-        "snowflake": "snowflake",
-        "storm": "cloud-lightning",
-        "cloud-fog": "cloud-fog",
-        "fog": "cloud-fog",
-        "mist": "cloud-fog",
-        "cloud-sun": "cloud-sun",
-        "cloud": "cloud",
-        "sun": "sun",
-    }
-
-    file_name = icon_aliases.get(icon_type.lower(), icon_type.lower())
-
+_ICON_ALIASES = {
+    "clear": "sun",
+    "rain": "cloud-rain",
+    "snow": "cloud-snow",
+    "snowflake": "snowflake",
+    "storm": "cloud-lightning",
+    "cloud-fog": "cloud-fog",
+    "fog": "cloud-fog",
+    "mist": "cloud-fog",
+    "cloud-sun": "cloud-sun",
+    "cloud": "cloud",
+    "sun": "sun",
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _load_icon(file_name: str, size: int) -> Optional[Image.Image]:
+    """Load icons/regular/<file_name>.png as a size x size centered ink mask.
+
+    The mask is an "L" image that is 255 where the icon is black. Returns None
+    if the PNG is missing, unreadable or blank. Cached because every forecast
+    redraws the same few icons; callers must not modify the returned image.
+    """
     # Path logic to find icons folder
     # app/modules/weather.py -> app/modules -> app -> project_root
     app_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     project_root = os.path.dirname(app_dir)
     icon_path = os.path.join(project_root, "icons", "regular", f"{file_name}.png")
 
-    if os.path.exists(icon_path):
-        try:
-            icon_img = Image.open(icon_path).convert("RGBA")
-            if icon_img.size != (size, size):
-                icon_img = icon_img.resize((size, size), Image.NEAREST)
-
-            # Flatten alpha then threshold to stable 1-bit output.
-            bg = Image.new("RGBA", icon_img.size, (255, 255, 255, 255))
-            bg.alpha_composite(icon_img)
-            icon_mono = bg.convert("L").point(
-                lambda value: 0 if value < 160 else 255, mode="1"
-            )
+    if not os.path.exists(icon_path):
+        return None
+    try:
+        icon_img = Image.open(icon_path).convert("RGBA")
+        if icon_img.size != (size, size):
+            icon_img = icon_img.resize((size, size), Image.NEAREST)
+
+        # Flatten alpha then threshold to stable 1-bit output.
+        bg = Image.new("RGBA", icon_img.size, (255, 255, 255, 255))
+        bg.alpha_composite(icon_img)
+        ink = bg.convert("L").point(lambda value: 255 if value < 160 else 0)
+
+        # Center based on drawn pixels (not source canvas) so spacing above/below looks even.
+        bbox = ink.getbbox()
+        if bbox is None:
+            return None
+        left, top, right, bottom = bbox
+        offset_x = ((size - (right - left)) // 2) - left
+        offset_y = ((size - (bottom - top)) // 2) - top
+
+        # Shift onto a size x size mask; whatever moves outside it is clipped.
+        mask = Image.new("L", (size, size), 0)
+        mask.paste(ink, (offset_x, offset_y))
+        return mask
+    except Exception:
+        return None
+
+
+def draw_icon_on_image(image: Image.Image, x: int, y: int, icon_type: str, size: int):
+    """Draw a weather icon onto a PIL image."""
+    file_name = _ICON_ALIASES.get(icon_type.lower(), icon_type.lower())
 
-            width, height = icon_mono.size
-            pixels = icon_mono.load()
-
-            # Center based on drawn pixels (not source canvas) so spacing above/below looks even.
-            left = width
-            top = height
-            right = -1
-            bottom = -1
-            for py in range(height):
-                for px in range(width):
-                    if pixels[px, py] == 0:
-                        left = min(left, px)
-                        top = min(top, py)
-                        right = max(right, px)
-                        bottom = max(bottom, py)
-
-            if right == -1:
-                return
-
-            glyph_w = (right - left) + 1
-            glyph_h = (bottom - top) + 1
-            offset_x = ((size - glyph_w) // 2) - left
-            offset_y = ((size - glyph_h) // 2) - top
-
-            for py in range(height):
-                for px in range(width):
-                    if pixels[px, py] == 0:
-                        draw_x = x + px + offset_x
-                        draw_y = y + py + offset_y
-                        if x <= draw_x < (x + size) and y <= draw_y < (y + size):
-                            draw.point((draw_x, draw_y), fill=0)
-        except Exception:
-            pass
+    icon_mask = _load_icon(file_name, size)
+    if icon_mask is not None:
+        image.paste(0, (x, y, x + size, y + size), icon_mask)
 
 
 def _draw_centered_text(
@@ -555,7 +550,7 @@ def draw_current_conditions_panel(
     icon_size = 52
     icon_x = x0 + ((split_x - x0) - icon_size) // 2
     icon_y = y0 + ((y1 - y0) - icon_size) // 2 - 1
-    draw_icon_on_image(draw, icon_x, icon_y, icon_type, icon_size)
+    draw_icon_on_image(panel, icon_x, icon_y, icon_type, icon_size)
 
     # Right-side text stack is vertically centered within the middle cell.
     gap_after_temp = 5
@@ -675,7 +670,7 @@ def draw_weather_forecast_image(
 
         icon_x = col_center - icon_size // 2
         icon_type = _get_icon_type(day_data.get("condition", ""))
-        draw_icon_on_image(draw, icon_x, icon_y, icon_type, icon_size)
+        draw_icon_on_image(image, icon_x, icon_y, icon_type, icon_size)
 
         precip = day_data.get("precipitation")
         precip_value = precip if precip is not None else 0
@@ -798,7 +793,7 @@ def draw_hourly_forecast_image(
 
             icon_x = col_center - icon_size // 2
             icon_type = _get_icon_type(hour_data.get("condition", ""))
-            draw_icon_on_image(draw, icon_x, icon_y, icon_type, icon_size)
+            draw_icon_on_image(image, icon_x, icon_y, icon_type, icon_size)
 
             temp = hour_data.get("temperature", "--")
             temp_str = _format_temperature(temp)
@@ -978,6 +978,30 @@ def test_printer_driver_handles_serial_init_failure(monkeypatch):
     assert driver.ser is None
 
 
+def test_printer_driver_logs_one_warning_per_write_failure_streak(caplog):
+    class FailingSerial:
+        is_open = True
+        fail = True
+
+        def write(self, data):  # noqa: ARG002
+            if self.fail:
+                raise OSError("link down")
+
+    driver = PrinterDriver(init_serial=False)
+    driver.ser = FailingSerial()
+
+    with caplog.at_level("DEBUG", logger="app.drivers.printer_serial"):
+        for _ in range(5):
+            driver._write(b"x")
+        driver.ser.fail = False
+        driver._write(b"x")
+        driver.ser.fail = True
+        driver._write(b"x")
+
+    warnings = [r for r in caplog.records if r.levelname == "WARNING"]
+    assert len(warnings) == 2
+
+
 def test_fetch_emails_sets_auth_failed_on_imap_auth_error(monkeypatch):
     config = {
         "email_service": "Custom",
@@ -54,3 +54,61 @@ def test_wait_for_idle_prefers_busy_pin(monkeypatch):
     driver.wait_for_idle(timeout=2.0, quiet_period=0.2)
 
     assert current["t"] >= 0.4
+
+
+def test_close_releases_busy_pin_and_is_idempotent():
+    closed = []
+
+    class _FakeSerial:
+        is_open = True
+
+        def close(self):
+            closed.append("serial")
+            self.is_open = False
+
+    class _FakeChip:
+        def close(self):
+            closed.append("chip")
+
+    driver = _make_driver()
+    driver.ser = _FakeSerial()
+    driver._busy_chip = _FakeChip()
+    driver._busy_handle = _FakeBusyHandle([0])
+
+    driver.close()
+    driver.close()
+
+    assert closed == ["chip", "serial"]
+    assert driver.ser is None
+    assert driver._busy_handle is None
+    assert driver._busy_chip is None
+
+
+def _fake_clock(monkeypatch):
+    current = {"t": 0.0}
+
+    def fake_sleep(seconds):
+        current["t"] += seconds
+
+    monkeypatch.setattr("app.drivers.printer_serial.time.time", lambda: current["t"])
+    monkeypatch.setattr("app.drivers.printer_serial.time.sleep", fake_sleep)
+    return current
+
+
+def test_wait_ready_returns_once_busy_pin_clears(monkeypatch):
+    driver = _make_driver()
+    driver._busy_handle = _FakeBusyHandle([1, 1, 1, 0])
+    current = _fake_clock(monkeypatch)
+
+    driver._wait_ready(0.5)
+
+    assert 0.05 <= current["t"] < 0.5
+
+
+def test_wait_ready_without_busy_pin_sleeps_full_timeout(monkeypatch):
+    driver = _make_driver()
+    current = _fake_clock(monkeypatch)
+
+    driver._wait_ready(0.5)
+
+    assert current["t"] == 0.5
@@ -0,0 +1,63 @@
+import app.drivers.printer_serial as printer_serial
+from app.drivers.printer_serial import PrinterDriver
+
+
+def _detect(monkeypatch, devices):
+    monkeypatch.setattr(printer_serial, "_SYSTEM", "Linux")
+    monkeypatch.setattr(printer_serial, "_discovered_port", None)
+    monkeypatch.setattr(
+        printer_serial.glob,
+        "glob",
+        lambda pattern: [d for d in devices if d.startswith(pattern.rstrip("*"))],
+    )
+    monkeypatch.setattr(printer_serial.os.path, "exists", lambda path: path in devices)
+    return PrinterDriver(init_serial=False).port
+
+
+def test_port_detect_prefers_gpio_serial(monkeypatch):
+    assert _detect(monkeypatch, ["/dev/ttyUSB0", "/dev/serial0"]) == "/dev/serial0"
+
+
+def test_port_detect_keeps_fixed_candidate_order(monkeypatch):
+    assert _detect(monkeypatch, ["/dev/ttyACM0", "/dev/ttyUSB1"]) == "/dev/ttyUSB1"
+
+
+def test_port_detect_finds_adapters_past_fixed_list(monkeypatch):
+    assert _detect(monkeypatch, ["/dev/ttyUSB3", "/dev/ttyUSB2"]) == "/dev/ttyUSB2"
+
+
+def test_port_detect_falls_back_to_gpio_serial(monkeypatch):
+    assert _detect(monkeypatch, []) == "/dev/serial0"
+
+
+def test_port_detect_remembers_found_port_but_not_fallback(monkeypatch):
+    assert _detect(monkeypatch, []) == "/dev/serial0"
+    assert printer_serial._discovered_port is None
+
+    assert _detect(monkeypatch, ["/dev/ttyACM0"]) == "/dev/ttyACM0"
+    monkeypatch.setattr(printer_serial.glob, "glob", lambda pattern: [])
+    assert PrinterDriver(init_serial=False).port == "/dev/ttyACM0"
+
+
+def test_port_detect_orders_extra_adapters_by_type_then_number(monkeypatch):
+    devices = ["/dev/ttyACM2", "/dev/ttyUSB10", "/dev/ttyUSB2"]
+    assert _detect(monkeypatch, devices) == "/dev/ttyUSB2"
+    assert sorted(devices, key=printer_serial._port_sort_key) == [
+        "/dev/ttyUSB2",
+        "/dev/ttyUSB10",
+        "/dev/ttyACM2",
+    ]
+
+
+def test_port_detect_rescans_when_remembered_port_disappears(monkeypatch):
+    assert _detect(monkeypatch, ["/dev/ttyUSB0"]) == "/dev/ttyUSB0"
+
+    devices = ["/dev/ttyUSB1"]
+    monkeypatch.setattr(
+        printer_serial.glob,
+        "glob",
+        lambda pattern: [d for d in devices if d.startswith(pattern.rstrip("*"))],
+    )
+    monkeypatch.setattr(printer_serial.os.path, "exists", lambda path: path in devices)
+    assert PrinterDriver(init_serial=False).port == "/dev/ttyUSB1"
+    assert printer_serial._discovered_port == "/dev/ttyUSB1"
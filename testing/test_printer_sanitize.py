@@ -0,0 +1,34 @@
+"""Serial printer text sanitization tests."""
+
+from app.drivers.printer_serial import PrinterDriver
+
+
+def _sanitize(text: str) -> str:
+    driver = PrinterDriver.__new__(PrinterDriver)
+    return driver._sanitize_text(text)
+
+
+def test_sanitize_keeps_printable_ascii_and_whitespace():
+    assert _sanitize("Hello, world!\tTab\r\nNext") == "Hello, world!\tTab\r\nNext"
+
+
+def test_sanitize_drops_control_characters():
+    assert _sanitize("bell\x07 esc\x1b del\x7f nul\x00") == "bell esc del nul"
+
+
+def test_sanitize_replaces_and_decomposes_unicode():
+    assert _sanitize("“Café” — 25° €5…") == '"Cafe" - 25o EUR5...'
+
+
+def test_sanitize_drops_unmappable_characters():
+    assert _sanitize("tail 日本 text") == "tail  text"
+
+
+def test_print_lines_sanitizes_and_buffers_each_line():
+    driver = PrinterDriver(init_serial=False)
+    driver.print_lines(["“Menu”", "", "Café — 3€", "two\nparts"], "bold")
+
+    assert driver.print_buffer == [
+        ("styled", {"text": text, "style": "bold"})
+        for text in ['"Menu"', "", "Cafe - 3EUR", "two", "parts"]
+    ]